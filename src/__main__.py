@@ -1,10 +1,6 @@
+import sys
+
 from app import main
-from tools.notion.notion import create_task, get_courses, get_projects, get_tasks
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
-    
-    
-    
-    
\ No newline at end of file
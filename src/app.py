@@ -7,7 +7,6 @@ from mcp.server.lowlevel import Server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
 from starlette.types import Receive, Scope, Send
 from starlette.routing import Mount, Route
 import uvicorn
@@ -17,11 +16,25 @@ from helpers import return_tools
 from tools import register_all_tools
 import mcp.types as types
 
-from tools.notion.notion import get_tasks
 from tools.registry import dispatch, list_all_tools
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded healthz response; the start message is rebuilt per probe so
+# middleware that edits headers in place cannot alter it
+_HEALTHZ_BODY = b'{"status":"ok"}'
+_HEALTHZ_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTHZ_BODY)).encode()),
+)
+
+class HealthzEndpoint:
+    """Pure-ASGI liveness endpoint (a class so Starlette does not wrap it in a Request)."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": list(_HEALTHZ_HEADERS)})
+        await send({"type": "http.response.body", "body": _HEALTHZ_BODY})
+
 # Setup basic CLI with variables passed on running script
 @click.command()
 @click.option(
@@ -39,9 +52,14 @@ logger = logging.getLogger(__name__)
     default=False,
     help="Enable debug mode (Starlette debug and Uvicorn reload)",
 )
+@click.option(
+    "--access-log/--no-access-log",
+    default=False,
+    help="Enable Uvicorn per-request access logging",
+)
 
 # Main method below
-def main(port: int, log_level: str, debug: bool):
+def main(port: int, log_level: str, debug: bool, access_log: bool):
     
     # Configure logging
     logging.basicConfig(
@@ -63,7 +81,8 @@ def main(port: int, log_level: str, debug: bool):
     register_all_tools()
     
     # Log tools
-    logger.info("\n\n" + return_tools() + "\n\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n\n%s\n\n", return_tools())
     
     @app.list_tools()
     async def list_tools() -> list[types.Tool]:
@@ -86,15 +105,12 @@ def main(port: int, log_level: str, debug: bool):
     async def handle_streamable_http(scope: Scope, receive: Receive, send: Send) -> None:
         await session_manager.handle_request(scope, receive, send)
         
-    # Define healthz endpoint
-    async def healthz(request):
-        return JSONResponse({"status": "ok"})
-    
     protected_http = require_bearer_token(
         handle_streamable_http, 
         api_auth_header,
         api_auth_token
     )
+    
         
     @asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
@@ -110,26 +126,34 @@ def main(port: int, log_level: str, debug: bool):
     starlette_app = Starlette(
         debug=debug,
         routes=[
-            Route("/healthz", healthz),
+            Route("/healthz", HealthzEndpoint(), methods=["GET"]),
             Mount("/mcp", app=protected_http)
         ],
         lifespan=lifespan,
     )
     
-    # Wrap ASGI application with CORS middleware to expose Mcp-Session-Id header for browser-based clients
-    starlette_app = CORSMiddleware(
+    # Wrap ASGI application with CORS middleware to expose Mcp-Session-Id header for browser-based clients.
+    # CORS sits outside auth so preflight requests are answered without a token.
+    app_with_cors = CORSMiddleware(
         starlette_app,
         allow_origins=["*"],
         allow_methods=["GET", "POST", "DELETE"],
         expose_headers=["Mcp-Session-Id"]
     )
     
+    async def asgi_app(scope: Scope, receive: Receive, send: Send) -> None:
+        # Health probes skip CORS; every other path, including the slashless /mcp redirect, keeps it
+        if scope["type"] == "http" and scope["path"] == "/healthz":
+            return await starlette_app(scope, receive, send)
+        return await app_with_cors(scope, receive, send)
+    
     uvicorn.run(
-        starlette_app,
+        asgi_app,
         host="0.0.0.0",
         port=port,
         log_level=log_level.lower(),
         reload=debug,
+        access_log=access_log,
     )
     
     return 0
\ No newline at end of file
@@ -1,8 +1,19 @@
+import hashlib
 import os
-from starlette.responses import JSONResponse
+from typing import Iterable
 from starlette.types import Receive, Scope, Send
 
+_loaded_env_files: set[str] = set()
+
+
 def load_env_from_file(file_path: str = ".env") -> None:
+    # Parse each file at most once per process: existing variables are never
+    # overridden and their consumers cache what they read, so re-parsing an
+    # edited file would not change anything
+    if file_path in _loaded_env_files:
+        return
+    _loaded_env_files.add(file_path)
+
     try:
         with open(file_path, "r") as env_file:
             for raw_line in env_file:
@@ -11,11 +22,11 @@ def load_env_from_file(file_path: str = ".env") -> None:
                     continue
                 if line.lower().startswith("export "):
                     line = line[7:].lstrip()
-                if "=" not in line:
+                key, sep, value = line.partition("=")
+                if not sep:
                     continue
-                key, value = line.split("=", 1)
                 key = key.strip()
-                value = value.strip().strip('"').strip("'")
+                value = value.strip().strip("\"'")
                 # Do not override existing environment variables
                 if key and key not in os.environ:
                     os.environ[key] = value
@@ -24,44 +35,65 @@ def load_env_from_file(file_path: str = ".env") -> None:
         pass
 
 
-def require_bearer_token(app, header_name: str, expected_token: str):
+def _json_error(status: int, body: bytes, headers: tuple[tuple[bytes, bytes], ...] = ()) -> tuple[int, tuple[tuple[bytes, bytes], ...], bytes]:
+    """Pre-encode the status, headers and body of a static JSON error response."""
+    return (
+        status,
+        (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        ),
+        body,
+    )
+
+
+_MISCONFIGURED = _json_error(500, b'{"detail":"Server misconfigured: API_AUTH_TOKEN not set"}')
+_MISSING_TOKEN = _json_error(401, b'{"detail":"Missing bearer token"}', ((b"www-authenticate", b"Bearer"),))
+_INVALID_TOKEN = _json_error(401, b'{"detail":"Invalid token"}', ((b"www-authenticate", b"Bearer"),))
+
+_BEARER_PREFIX = b"bearer "
+
+
+def _token_digest(token: bytes) -> bytes:
+    return hashlib.sha256(token).digest()
+
+
+def require_bearer_token(app, header_name: str, expected_tokens: str | Iterable[str]):
+    """Require a valid bearer token on every HTTP request to `app`; mount it only where auth applies."""
+    # ASGI header names are lowercased bytes, so match against a pre-encoded name
+    header_name_bytes = header_name.lower().encode("latin-1")
+    if isinstance(expected_tokens, str):
+        expected_tokens = [expected_tokens]
+    # Store digests rather than raw tokens: membership is a single hash lookup
+    # regardless of token count, and never compares secret bytes directly
+    valid_digests = frozenset(_token_digest(t.encode()) for t in expected_tokens if t)
+
+    async def reject(send: Send, response: tuple[int, tuple[tuple[bytes, bytes], ...], bytes]) -> None:
+        status, headers, body = response
+        # Fresh messages per send: middleware such as CORS edits the headers in place
+        await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+        await send({"type": "http.response.body", "body": body})
+
     async def auth_app(scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             return await app(scope, receive, send)
-        
-        # Only protect the MCP endpoint
-        path = scope.get("path", "")
-        if not path.startswith("/mcp"):
-            return await app(scope, receive, send)
-        
-        if not expected_token:
-            response = JSONResponse({
-                "detail": "Server misconfigured: API_AUTH_TOKEN not set"
-            }, status_code=500,)
-            
-            return await response(scope, receive, send)
-        
+
+        if not valid_digests:
+            return await reject(send, _MISCONFIGURED)
+
         header_value = None
-        for k, v in scope.get("headers", []):
-            if k.decode().lower() == header_name.lower():
-                header_value = v.decode()
+        for k, v in scope["headers"]:
+            if k == header_name_bytes:
+                header_value = v
                 break
-            
-        if not header_value or not header_value.lower().startswith("bearer "):
-            response = JSONResponse({
-                "detail": "Missing bearer token"
-            }, status_code=401, headers={"WWW-Authenticate": "Bearer"})
-            
-            return await response(scope, receive, send)
-        
-        token = header_value.split(" ", 1)[1]
-        if token != expected_token:
-            response = JSONResponse({
-                "detail": "Invalid token"
-            }, status_code=401, headers={"WWW-Authenticate": "Bearer"})
-            
-            return await response(scope, receive, send)
-        
+
+        if not header_value or header_value[:7].lower() != _BEARER_PREFIX:
+            return await reject(send, _MISSING_TOKEN)
+
+        if _token_digest(header_value[7:]) not in valid_digests:
+            return await reject(send, _INVALID_TOKEN)
+
         return await app(scope, receive, send)
-    
-    return auth_app
\ No newline at end of file
+
+    return auth_app
@@ -1,18 +1,18 @@
 from tools.registry import list_all_tools
 
+def _truncate(description: str | None, limit: int = 120) -> str:
+    # Keep description concise in logs
+    description = (description or "").strip()
+    if len(description) > limit:
+        return description[:limit - 3] + "..."
+    return description
+
 def return_tools():
     tools = list_all_tools()
-        
+
     # Log toools
     if tools:
-        lines = []
-        for tool in tools:
-            name = getattr(tool, "name", "<unknown>")
-            description = getattr(tool, "description", "").strip()
-            # Keep description concise in logs
-            if len(description) > 120:
-                description = description[:117] + "..."
-            lines.append(f"- {name}: {description}")
+        lines = [f"- {tool.name}: {_truncate(tool.description)}" for tool in tools]
         return f"Loaded following tools (count={len(tools)}):\n{'\n'.join(lines)}"
     else:
-        return "No tools loaded."
\ No newline at end of file
+        return "No tools loaded."
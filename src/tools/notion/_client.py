@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import os
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from urllib.parse import unquote
+import httpx
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError
+import orjson
+from auth import load_env_from_file
+
+logger = logging.getLogger(__name__)
+
+# Database kind -> environment variable holding its ID
+_DATABASE_ENV_VARS = {
+    "tasks": "TASK_DATABASE",
+    "projects": "PROJECT_DATABASE",
+    "courses": "COURSE_DATABASE"
+}
+
+# Pool shared by all Notion requests: keep-alive skips TCP/TLS setup after the first
+# call, and HTTP/2 multiplexes concurrent requests over a single connection.
+# (Timeouts are set by notion-client's own `timeout_ms` option.)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0)
+
+# Notion allows about three concurrent requests per integration; queue beyond
+# that in-process instead of spending retries on 429s
+MAX_CONCURRENT_REQUESTS = 3
+_REQUEST_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Throttled (429) and unavailable (5xx) responses are retried with exponential
+# backoff, unless Notion says how long to wait in Retry-After; either wait is
+# capped so one response cannot stall a tool call
+_MAX_ATTEMPTS = 4
+_BACKOFF_SECONDS = 0.25
+_MAX_RETRY_DELAY = 5.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _retry_delay(error: HTTPResponseError, attempt: int) -> float:
+    try:
+        delay = float(error.headers["retry-after"])
+    except (KeyError, ValueError):
+        delay = -1.0
+    # Missing, negative or NaN values fall back to exponential backoff
+    if not delay >= 0:
+        delay = _BACKOFF_SECONDS * 2 ** (attempt - 1)
+    return min(delay, _MAX_RETRY_DELAY)
+
+class _NotionAsyncClient(AsyncClient):
+    """
+    AsyncClient with a process-wide concurrency cap, retries on 429/5xx and orjson decoding.
+    """
+
+    async def request(
+        self,
+        path: str,
+        method: str,
+        query: Optional[dict] = None,
+        body: Optional[dict] = None,
+        form_data: Optional[dict] = None,
+        auth: Optional[str] = None,
+    ) -> Any:
+        # Creating a page is not idempotent: only retry it when it was throttled (never applied)
+        retry_server_errors = not (method == "POST" and path == "pages")
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                async with _REQUEST_SEMAPHORE:
+                    return await super().request(path, method, query, body, form_data, auth)
+            except HTTPResponseError as e:
+                retryable = e.status == 429 or (retry_server_errors and e.status in _RETRYABLE_STATUSES)
+                if not retryable or attempt == _MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    "Notion returned %s for %s %s; retrying in %.2fs (attempt %d of %d)",
+                    e.status, method, path, delay, attempt, _MAX_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
+
+    def _parse_response(self, response: httpx.Response) -> Any:
+        if response.is_success:
+            return orjson.loads(response.content)
+        # Errors keep notion-client's own handling
+        return super()._parse_response(response)
+
+_CLIENT: Optional[AsyncClient] = None
+_DATABASES: Optional[Mapping[str, str]] = None
+_DATA_SOURCE_IDS: Optional[Mapping[str, str]] = None
+# Database kind -> {property name: property id}, filled alongside _DATA_SOURCE_IDS
+_PROPERTY_IDS: Optional[Mapping[str, Mapping[str, str]]] = None
+_DATA_SOURCE_IDS_LOCK = asyncio.Lock()
+
+def get_notion_client() -> AsyncClient:
+    """Return the process-wide async Notion client, creating it on first use.
+
+    Raises:
+        RuntimeError: When the Notion auth token is not present
+    """
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+
+    # Try to read from environment first
+    token = os.environ.get("NOTION_AUTH_TOKEN")
+    if not token:
+        # Attempt to load from .env lazily if not already loaded
+        load_env_from_file()
+        token = os.environ.get("NOTION_AUTH_TOKEN")
+    if not token:
+        raise RuntimeError("NOTION_AUTH_TOKEN is not set. Add it to your environment or .env")
+    http_client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+    _CLIENT = _NotionAsyncClient(client=http_client, auth=token, log_level=logging.WARNING)
+    return _CLIENT
+
+def get_databases() -> Mapping[str, str]:
+    """
+    Load and return all required Notion database IDs.
+    
+    The IDs are resolved once per process and cached afterwards.
+    
+    Returns:
+        A read-only mapping with keys: 'tasks', 'projects', 'courses'
+        
+    Raises:
+        RuntimeError: If any required database ID is not set
+    """
+    global _DATABASES
+    if _DATABASES is not None:
+        return _DATABASES
+
+    # Try to read from environment first, then load .env once if needed
+    ids = {kind: os.environ.get(var) for kind, var in _DATABASE_ENV_VARS.items()}
+    if not all(ids.values()):
+        load_env_from_file()
+        ids = {kind: os.environ.get(var) for kind, var in _DATABASE_ENV_VARS.items()}
+    
+    missing = [var for kind, var in _DATABASE_ENV_VARS.items() if not ids[kind]]
+    if missing:
+        raise RuntimeError(
+            f"Missing required database IDs: {', '.join(missing)}. "
+            "Add them to your environment or .env file"
+        )
+    
+    # Read-only view so callers cannot mutate the shared cache
+    _DATABASES = MappingProxyType(ids)
+    return _DATABASES
+
+async def _fetch_data_source(kind: str) -> tuple[str, Mapping[str, str]]:
+    """
+    Return the first data source ID of the given database and its property IDs.
+    
+    Args:
+        kind: One of 'tasks', 'projects', 'courses'
+        
+    Returns:
+        A (data_source_id, {property name: property id}) tuple
+    """
+    client = get_notion_client()
+    database_id = get_databases()[kind]
+    label = kind.capitalize()
+
+    try:
+        dbs = await client.databases.retrieve(database_id)
+        data_sources = dbs.get("data_sources")
+        if not data_sources or not isinstance(data_sources, list):
+            raise RuntimeError(f"{label} database has no data_sources in Notion response")
+        first = data_sources[0]
+        ds_id = first.get("id")
+        if not ds_id:
+            raise RuntimeError(f"{label} data source id missing from Notion response")
+        data_source = await client.data_sources.retrieve(ds_id)
+        # Property IDs come URL-encoded; unquote them so the query string encodes them once
+        property_ids = {name: unquote(prop["id"]) for name, prop in data_source.get("properties", {}).items()}
+    except Exception as e:
+        logger.exception("Failed to retrieve %s data source id", kind)
+        raise RuntimeError(f"Failed to retrieve {kind} data source id: {e}")
+
+    return ds_id, MappingProxyType(property_ids)
+
+async def resolve_all_data_source_ids() -> Mapping[str, str]:
+    """
+    Return the data source IDs of all databases, keyed like `get_databases()`.
+    
+    On first use the lookups are issued concurrently and cached for the process,
+    together with each data source's property IDs.
+    """
+    global _DATA_SOURCE_IDS, _PROPERTY_IDS
+    if _DATA_SOURCE_IDS is not None:
+        return _DATA_SOURCE_IDS
+
+    async with _DATA_SOURCE_IDS_LOCK:
+        if _DATA_SOURCE_IDS is None:
+            kinds = tuple(get_databases())
+            results = await asyncio.gather(*(_fetch_data_source(kind) for kind in kinds))
+            _PROPERTY_IDS = MappingProxyType({kind: property_ids for kind, (_, property_ids) in zip(kinds, results)})
+            _DATA_SOURCE_IDS = MappingProxyType({kind: ds_id for kind, (ds_id, _) in zip(kinds, results)})
+    return _DATA_SOURCE_IDS
+
+async def get_property_ids(kind: str, names: tuple[str, ...]) -> list[str]:
+    """
+    Return the IDs of the named properties of a database, for `filter_properties`.
+    
+    Names missing from the data source are skipped.
+    """
+    await resolve_all_data_source_ids()
+    property_ids = _PROPERTY_IDS[kind]
+    return [property_ids[name] for name in names if name in property_ids]
+
+async def get_tasks_data_source_id() -> str:
+    return (await resolve_all_data_source_ids())["tasks"]
+
+async def get_projects_data_source_id() -> str:
+    return (await resolve_all_data_source_ids())["projects"]
+
+async def get_courses_data_source_id() -> str:
+    return (await resolve_all_data_source_ids())["courses"]
+
+def reset_notion_cache() -> None:
+    """
+    Drop the cached client, database IDs, data source IDs and property IDs (e.g. for test isolation).
+    
+    Cached Notion records live in notion.py; clear those with `reset_relation_cache()`.
+    """
+    global _CLIENT, _DATABASES, _DATA_SOURCE_IDS, _PROPERTY_IDS
+    _CLIENT = None
+    _DATABASES = None
+    _DATA_SOURCE_IDS = None
+    _PROPERTY_IDS = None
@@ -1,278 +1,347 @@
+import asyncio
+from dataclasses import dataclass
 import logging
-import os
-from typing import Any, TypedDict, Optional
-from notion_client import Client
+import time
+from typing import Any, AsyncIterator, Optional
+from notion_client import APIErrorCode, APIResponseError, AsyncClient
 import mcp.types as types
-from auth import load_env_from_file
 from tools.registry import register_tool
-from .utils import build_date_filter, check_if_projects_or_courses_exist, get_priority_name, retrieve_course_info, retrieve_project_info, retrieve_task_info
+from ._client import get_courses_data_source_id, get_databases, get_notion_client, MAX_CONCURRENT_REQUESTS, get_projects_data_source_id, get_property_ids, get_tasks_data_source_id
+from .utils import build_date_filter, collect_relation_ids, Course, COURSE_PROPERTIES, get_status_name, PRIORITY_NAMES, Project, PROJECT_PROPERTIES, retrieve_course_info, retrieve_project_info, retrieve_task_info, Task, TASK_PROPERTIES
 
 logger = logging.getLogger(__name__)
 
-class CreateTaskParams(TypedDict, total=False):
-    """Parameters for creating a task in Notion."""
-    title: str  # Required
-    due_date: str  # Required
-    priority: int  # Required
-    project_id: Optional[str]
-    course_id: Optional[str]
-
-def get_notion_client() -> Client:
-    """Create and return a configured Notion client.
-
-    Raises:
-        RuntimeError: When the Notion auth token is not present
+@dataclass(slots=True, frozen=True)
+class CreateTaskParams:
     """
-    # Try to read from environment first
-    token = os.environ.get("NOTION_AUTH_TOKEN")
-    if not token:
-        # Attempt to load from .env lazily if not already loaded
-        load_env_from_file()
-        token = os.environ.get("NOTION_AUTH_TOKEN")
-    if not token:
-        raise RuntimeError("NOTION_AUTH_TOKEN is not set. Add it to your environment or .env")
-    return Client(auth=token, log_level=logging.WARNING)
-
-def get_databases() -> dict[str, str]:
-    """
-    Load and return all required Notion database IDs.
+    Validated parameters for creating a task in Notion.
+    
+    Every instance is checked on construction, so `create_task` can use the fields as-is.
     
-    Returns:
-        A dict with keys: 'tasks', 'projects', 'courses'
-        
     Raises:
-        RuntimeError: If any required database ID is not set
+        ValueError: If a required field is missing or out of range
+        TypeError: If an optional relation id is not a string
     """
-    # Try to read from environment first, then load .env if needed
-    task_db = os.environ.get("TASK_DATABASE")
-    project_db = os.environ.get("PROJECT_DATABASE")
-    course_db = os.environ.get("COURSE_DATABASE")
-    
-    if not task_db or not project_db or not course_db:
-        load_env_from_file()
-        task_db = os.environ.get("TASK_DATABASE")
-        project_db = os.environ.get("PROJECT_DATABASE")
-        course_db = os.environ.get("COURSE_DATABASE")
-    
-    # Collect missing database IDs
-    missing = []
-    if not task_db:
-        missing.append("TASK_DATABASE")
-    if not project_db:
-        missing.append("PROJECT_DATABASE")
-    if not course_db:
-        missing.append("COURSE_DATABASE")
-    
-    if missing:
-        raise RuntimeError(
-            f"Missing required database IDs: {', '.join(missing)}. "
-            "Add them to your environment or .env file"
+    title: str
+    due_date: str
+    priority: int  # 1 (highest) .. len(PRIORITY_NAMES) - 1
+    project_id: Optional[str] = None
+    course_id: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.title, str) or not self.title.strip():
+            raise ValueError("'title' is required and must be a non-empty string")
+        if not isinstance(self.due_date, str) or not self.due_date.strip():
+            raise ValueError("'due_date' is required and must be a non-empty ISO date string")
+        if not isinstance(self.priority, int):
+            raise ValueError(f"'priority' is required and must be an integer (1..{len(PRIORITY_NAMES) - 1})")
+        if not 1 <= self.priority < len(PRIORITY_NAMES):
+            raise ValueError(f"'priority' must be between 1 and {len(PRIORITY_NAMES) - 1}")
+        if self.project_id is not None and not isinstance(self.project_id, str):
+            raise TypeError("'project_id' must be a string if provided")
+        if self.course_id is not None and not isinstance(self.course_id, str):
+            raise TypeError("'course_id' must be a string if provided")
+
+    @classmethod
+    def from_arguments(cls, arguments: dict[str, Any]) -> "CreateTaskParams":
+        """Build the parameters from raw tool arguments, trimming the string fields."""
+        title = arguments.get("title")
+        due_date = arguments.get("due_date")
+
+        return cls(
+            title=title.strip() if isinstance(title, str) else "",
+            due_date=due_date.strip() if isinstance(due_date, str) else "",
+            priority=arguments.get("priority"),
+            project_id=arguments.get("project_id"),
+            course_id=arguments.get("course_id"),
         )
-    
-    return {
-        "tasks": task_db,
-        "projects": project_db,
-        "courses": course_db
+
+# Static request fragments, shared across calls (notion-client never mutates them)
+_NOT_STARTED_FILTER = {"property": "Status", "status": {"equals": "Not Started"}}
+_ACTIVE_FILTER = {"property": "Status", "status": {"equals": "Active"}}
+_IN_PROGRESS_FILTER = {"property": "Status", "status": {"equals": "In progress"}}
+_DEFAULT_ICON = {
+    "type": "external",
+    "external": {
+        "url": "https://www.notion.so/icons/circle_gray.svg?mode=dark"
     }
+}
 
-def get_tasks_data_source_id() -> str:
-    client = get_notion_client()
-    databases = get_databases()
-    database_id = databases["tasks"]
+# Notion's maximum page size for data source queries
+_QUERY_PAGE_SIZE = 100
 
-    try:
-        dbs = client.databases.retrieve(database_id)
-        data_sources = dbs.get("data_sources")
-        if not data_sources or not isinstance(data_sources, list):
-            raise RuntimeError("Tasks database has no data_sources in Notion response")
-        first = data_sources[0]
-        ds_id = first.get("id")
-        if not ds_id:
-            raise RuntimeError("Tasks data source id missing from Notion response")
-        return ds_id
-    except Exception as e:
-        logger.exception("Failed to retrieve tasks data source id")
-        raise RuntimeError(f"Failed to retrieve tasks data source id: {e}")
+# Database kind -> properties requested from Notion (see `filter_properties`)
+_PROPERTIES_BY_KIND = {
+    "tasks": TASK_PROPERTIES,
+    "projects": PROJECT_PROPERTIES,
+    "courses": COURSE_PROPERTIES,
+}
 
-def get_projects_data_source_id() -> str:
-    client = get_notion_client()
-    databases = get_databases()
-    database_id = databases["projects"]
+async def _filter_properties(kind: str) -> list[str]:
+    return await get_property_ids(kind, _PROPERTIES_BY_KIND[kind])
 
-    try:
-        dbs = client.databases.retrieve(database_id)
-        data_sources = dbs.get("data_sources")
-        if not data_sources or not isinstance(data_sources, list):
-            raise RuntimeError("Projects database has no data_sources in Notion response")
-        first = data_sources[0]
-        ds_id = first.get("id")
-        if not ds_id:
-            raise RuntimeError("Projects data source id missing from Notion response")
-        return ds_id
-    except Exception as e:
-        logger.exception("Failed to retrieve projects data source id")
-        raise RuntimeError(f"Failed to retrieve projects data source id: {e}")
+async def iter_query(client: AsyncClient, data_source_id: str, label: str, *, limit: Optional[int] = None, **kwargs: Any) -> AsyncIterator[dict]:
+    """
+    Yield the results of a data source query, following `next_cursor` across pages.
+    
+    Pages are requested lazily, so callers that stop early never fetch the rest.
+    
+    Args:
+        client: Notion client
+        data_source_id: Data source to query
+        label: What is being queried (e.g. 'tasks'), used in errors
+        limit: Optional maximum number of results to yield
+        **kwargs: Extra query arguments such as `filter` or `sorts`
+        
+    Raises:
+        RuntimeError: If a request fails or a response has no 'results'
+    """
+    cursor = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        page_size = _QUERY_PAGE_SIZE if remaining is None else min(_QUERY_PAGE_SIZE, remaining)
+        try:
+            res = await client.data_sources.query(data_source_id, page_size=page_size, start_cursor=cursor, **kwargs)
+        except Exception as e:
+            logger.exception("Failed to query %s from Notion", label)
+            raise RuntimeError(f"Failed to query {label}: {e}")
+
+        results = res.get("results")
+        if results is None:
+            raise RuntimeError(f"Malformed Notion response: missing 'results' for {label} query")
+        for result in results:
+            yield result
+
+        cursor = res.get("next_cursor")
+        if not res.get("has_more") or not cursor:
+            return
+        if remaining is not None:
+            remaining -= len(results)
+
+# Active projects and in-progress courses change on the order of days, so their
+# full lists are reused for a minute: kind -> (expires_at, records)
+_RELATION_CACHE_TTL = 60.0
+_RELATION_CACHE: dict[str, tuple[float, list]] = {}
+# Page id -> (expires_at, record), from per-page lookups under the same TTL; the
+# record is None when the page is absent or does not have the wanted status
+_PAGE_CACHE: dict[str, tuple[float, Optional[Any]]] = {}
+_RELATION_CACHE_LOCKS = {"projects": asyncio.Lock(), "courses": asyncio.Lock()}
+
+def _fresh_relations(kind: str) -> Optional[list]:
+    entry = _RELATION_CACHE.get(kind)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+async def _cached_relations(kind: str, query) -> list:
+    """
+    Return the cached records for `kind`, running `query` when they are missing or expired.
+    
+    The returned list is shared between callers and must not be mutated.
+    """
+    records = _fresh_relations(kind)
+    if records is not None:
+        return records
+
+    # One refresh at a time; callers queued behind it reuse its result
+    async with _RELATION_CACHE_LOCKS[kind]:
+        records = _fresh_relations(kind)
+        if records is None:
+            records = await query()
+            _RELATION_CACHE[kind] = (time.monotonic() + _RELATION_CACHE_TTL, records)
+    return records
+
+def reset_relation_cache() -> None:
+    """Drop cached project/course lists, cached pages and in-flight page lookups (e.g. for test isolation)."""
+    _RELATION_CACHE.clear()
+    _PAGE_CACHE.clear()
+    _INFLIGHT_PAGES.clear()
+
+# Referenced pages are retrieved one by one while they fit in a single concurrent
+# wave (about one round trip); past that a single bulk query is cheaper
+_SPARSE_LOOKUP_THRESHOLD = MAX_CONCURRENT_REQUESTS
+
+# Errors meaning the page is gone or not shared with the integration
+_ABSENT_PAGE_CODES = frozenset({APIErrorCode.ObjectNotFound, APIErrorCode.RestrictedResource})
+
+# Page id -> in-flight retrieval; concurrent tool calls asking for the same page share it
+_INFLIGHT_PAGES: dict[str, asyncio.Future] = {}
+
+async def _retrieve_pages(kind: str, page_ids: set[str], status: str, parse) -> list:
+    """
+    Retrieve the given pages concurrently, keeping only those with the given status.
+    
+    Outcomes are cached per page id for `_RELATION_CACHE_TTL`, so repeated calls
+    only request pages they have not seen recently. A page already being retrieved for another call is awaited rather than requested
+    again. Pages that are missing, not shared with the integration or trashed are
+    skipped, as the bulk query would never return them; with the status check this
+    keeps results identical to the bulk status-filtered query.
+    """
+    now = time.monotonic()
+    records = []
+    missing = []
+    for page_id in page_ids:
+        entry = _PAGE_CACHE.get(page_id)
+        if entry is not None and entry[0] > now:
+            if entry[1] is not None:
+                records.append(entry[1])
+        else:
+            missing.append(page_id)
+    if not missing:
+        return records
 
-def get_courses_data_source_id() -> str:
     client = get_notion_client()
-    databases = get_databases()
-    database_id = databases["courses"]
-
-    try:
-        dbs = client.databases.retrieve(database_id)
-        data_sources = dbs.get("data_sources")
-        if not data_sources or not isinstance(data_sources, list):
-            raise RuntimeError("Courses database has no data_sources in Notion response")
-        first = data_sources[0]
-        ds_id = first.get("id")
-        if not ds_id:
-            raise RuntimeError("Courses data source id missing from Notion response")
-        return ds_id
-    except Exception as e:
-        logger.exception("Failed to retrieve courses data source id")
-        raise RuntimeError(f"Failed to retrieve courses data source id: {e}")
-
-
-def get_tasks(time_range: str) -> list[dict]:
+    filter_properties = await _filter_properties(kind)
+
+    async def fetch(page_id: str) -> Optional[dict]:
+        try:
+            page = await client.pages.retrieve(page_id, filter_properties=filter_properties)
+        except APIResponseError as e:
+            if e.code in _ABSENT_PAGE_CODES:
+                logger.info("Page %s is not accessible (%s); treating it as absent", page_id, e.code)
+                return None
+            logger.exception("Failed to retrieve page %s from Notion", page_id)
+            raise RuntimeError(f"Failed to retrieve page {page_id}: {e}")
+        except Exception as e:
+            logger.exception("Failed to retrieve page %s from Notion", page_id)
+            raise RuntimeError(f"Failed to retrieve page {page_id}: {e}")
+        # pages.retrieve still returns trashed pages, which queries leave out
+        if page.get("in_trash") or page.get("archived"):
+            return None
+        return page
+
+    async def retrieve(page_id: str) -> Optional[dict]:
+        future = _INFLIGHT_PAGES.get(page_id)
+        if future is None:
+            future = asyncio.ensure_future(fetch(page_id))
+            _INFLIGHT_PAGES[page_id] = future
+            future.add_done_callback(lambda _: _INFLIGHT_PAGES.pop(page_id, None))
+        # Shield so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(future)
+
+    pages = await asyncio.gather(*(retrieve(page_id) for page_id in missing))
+    # Prune expired entries so pages no longer referenced do not accumulate
+    for page_id in [page_id for page_id, (expires, _) in _PAGE_CACHE.items() if expires <= now]:
+        del _PAGE_CACHE[page_id]
+    expires_at = time.monotonic() + _RELATION_CACHE_TTL
+    for page_id, page in zip(missing, pages):
+        record = parse(page) if page is not None and get_status_name(page) == status else None
+        _PAGE_CACHE[page_id] = (expires_at, record)
+        if record is not None:
+            records.append(record)
+    return records
+
+async def _resolve_relations(kind: str, page_ids: set[str], status: str, fetch_all, parse) -> list:
+    """
+    Fetch the records behind referenced relation ids.
+    
+    A fresh cached list is filtered locally. Otherwise small sets are retrieved
+    page by page, and larger ones fall back to `fetch_all`, the bulk
+    status-filtered query.
+    """
+    if not page_ids:
+        return []
+    cached = _fresh_relations(kind)
+    if cached is not None:
+        return [record for record in cached if record.id in page_ids]
+    if len(page_ids) <= _SPARSE_LOOKUP_THRESHOLD:
+        return await _retrieve_pages(kind, page_ids, status, parse)
+    return await fetch_all()
+
+async def get_tasks(time_range: str) -> list[Task]:
     """
     Get tasks for the specified time range with "Not Started" status.
     
+    The project and course lookups used to enrich the tasks are issued concurrently.
+    
     Args:
-        time_range: One of "today", "tomorrow", or "week_from_today" (synonyms like "this week" are accepted).
+        time_range: One of "today", "tomorrow", or "week_from_today"
         
     Returns:
-        Query results from Notion API
+        `Task` records whose `project` and `course` are the related `Project` and
+        `Course` records, or None when the task has no such relation or the related
+        page is not active
     """
     client = get_notion_client()
-    id = get_tasks_data_source_id()
+    id = await get_tasks_data_source_id()
 
     # Build date filter for the specified time range
     date_filter = build_date_filter(time_range)
 
     # Combine status filter with date filter
-    filter_conditions = {
-        "and": [
-            {
-                "property": "Status",
-                "status": {
-                    "equals": "Not Started"
-                }
-            },
-            *date_filter["and"]
-        ]
-    }
-
-    try:
-        res = client.data_sources.query(id, filter=filter_conditions)
-    except Exception as e:
-        logger.exception("Failed to query tasks from Notion")
-        raise RuntimeError(f"Failed to query tasks: {e}")
+    filter_conditions = {"and": [_NOT_STARTED_FILTER, *date_filter["and"]]}
 
-    results = res.get("results")
-    if results is None:
-        raise RuntimeError("Malformed Notion response: missing 'results' for tasks query")
-    if len(results) == 0:
+    filter_properties = await _filter_properties("tasks")
+    tasks = [
+        retrieve_task_info(task)
+        async for task in iter_query(client, id, "tasks", filter=filter_conditions, filter_properties=filter_properties)
+    ]
+    if len(tasks) == 0:
         return []
 
-    tasks = [retrieve_task_info(task) for task in results]
-
-    # add project and course to tasks
-    if not check_if_projects_or_courses_exist(tasks):
+    # add project and course to tasks, fetching only the relations that are referenced
+    project_ids, course_ids = collect_relation_ids(tasks)
+    if not project_ids and not course_ids:
         return tasks
 
-    projects = get_projects()
-    courses = get_courses()
+    projects, courses = await asyncio.gather(
+        _resolve_relations("projects", project_ids, "Active", get_projects, retrieve_project_info),
+        _resolve_relations("courses", course_ids, "In progress", get_courses, retrieve_course_info),
+    )
 
-    for task in tasks:
-        if task["project"] is not None:
-            task["project"] = next((p for p in projects if p["id"] == task["project"]), None)
-        if task["course"] is not None:
-            task["course"] = next((c for c in courses if c["id"] == task["course"]), None)
+    projects_by_id = {p.id: p for p in projects}
+    courses_by_id = {c.id: c for c in courses}
 
-    return tasks
-
-def get_projects() -> list[dict]:
-    client = get_notion_client()
-    id = get_projects_data_source_id()
+    # Unreferenced relations are None, and .get(None) stays None
+    return [
+        task._replace(project=projects_by_id.get(task.project), course=courses_by_id.get(task.course))
+        for task in tasks
+    ]
 
-    try:
-        res = client.data_sources.query(
-            id,
-            filter={
-                "property": "Status",
-                "status": {
-                    "equals": "Active"
-                }
-            }
-        )
-    except Exception as e:
-        logger.exception("Failed to query projects from Notion")
-        raise RuntimeError(f"Failed to query projects: {e}")
+async def get_projects() -> list[Project]:
+    return await _cached_relations("projects", _query_projects)
 
-    results = res.get("results")
-    if results is None:
-        raise RuntimeError("Malformed Notion response: missing 'results' for projects query")
+async def get_courses() -> list[Course]:
+    return await _cached_relations("courses", _query_courses)
 
-    return [retrieve_project_info(project) for project in results]
-
-def get_courses() -> list[dict]:
+async def _query_projects() -> list[Project]:
     client = get_notion_client()
-    id = get_courses_data_source_id()
+    id = await get_projects_data_source_id()
+    filter_properties = await _filter_properties("projects")
 
-    try:
-        res = client.data_sources.query(
-            id,
-            filter={
-                "property": "Status",
-                "status": {
-                    "equals": "In progress"
-                }
-            }
-        )
-    except Exception as e:
-        logger.exception("Failed to query courses from Notion")
-        raise RuntimeError(f"Failed to query courses: {e}")
+    return [
+        retrieve_project_info(project)
+        async for project in iter_query(client, id, "projects", filter=_ACTIVE_FILTER, filter_properties=filter_properties)
+    ]
 
-    results = res.get("results")
-    if results is None:
-        raise RuntimeError("Malformed Notion response: missing 'results' for courses query")
+async def _query_courses() -> list[Course]:
+    client = get_notion_client()
+    id = await get_courses_data_source_id()
+    filter_properties = await _filter_properties("courses")
 
-    return [retrieve_course_info(course) for course in results]
+    return [
+        retrieve_course_info(course)
+        async for course in iter_query(client, id, "courses", filter=_IN_PROGRESS_FILTER, filter_properties=filter_properties)
+    ]
 
-def create_task(params: CreateTaskParams) -> str:
+async def create_task(params: CreateTaskParams) -> str:
     """
     Create a task in Notion.
     
     Args:
-        params: Dictionary containing task parameters:
+        params: Validated task parameters
     
     Returns:
-        The created page response from Notion API
+        The URL of the created page
     """
+    title = params.title
+    due_date = params.due_date
+    priority = PRIORITY_NAMES[params.priority]
+    project_id = params.project_id
+    course_id = params.course_id
+
     client = get_notion_client()
     database_id = get_databases()["tasks"]
-
-    # Validate and extract parameters
-    if "title" not in params or not isinstance(params["title"], str) or not params["title"].strip():
-        raise ValueError("'title' is required and must be a non-empty string")
-    if "due_date" not in params or not isinstance(params["due_date"], str) or not params["due_date"].strip():
-        raise ValueError("'due_date' is required and must be a non-empty ISO date string")
-    if "priority" not in params or not isinstance(params["priority"], int):
-        raise ValueError("'priority' is required and must be an integer (1..3)")
-
-    title = params["title"].strip()
-    due_date = params["due_date"].strip()
-    try:
-        priority = get_priority_name(params["priority"])
-    except ValueError as e:
-        raise ValueError(str(e))
-    project_id = params.get("project_id")
-    course_id = params.get("course_id")
-
-    if project_id is not None and not isinstance(project_id, str):
-        raise TypeError("'project_id' must be a string if provided")
-    if course_id is not None and not isinstance(course_id, str):
-        raise TypeError("'course_id' must be a string if provided")
     
     # Build properties for the page
     properties = {
@@ -312,18 +381,13 @@ def create_task(params: CreateTaskParams) -> str:
     # Build the page object
     page_data = {
         "parent": {"database_id": database_id},
-        "icon": {
-            "type": "external",
-            "external": {
-                "url": "https://www.notion.so/icons/circle_gray.svg?mode=dark"
-            }
-        },
+        "icon": _DEFAULT_ICON,
         "properties": properties
         
     }
     
     try:
-        res = client.pages.create(**page_data)
+        res = await client.pages.create(**page_data)
     except Exception as e:
         logger.exception("Failed to create task page in Notion")
         raise RuntimeError(f"Failed to create task: {e}")
@@ -358,7 +422,7 @@ async def get_tasks_handler(arguments: dict[str, Any], ctx: Any) -> list[types.C
         raise TypeError("'query' must be a string.")
     
     try:
-        tasks = get_tasks(time_range)
+        tasks = await get_tasks(time_range)
     except Exception as e:
         logger.exception("Failed to get tasks")
         raise RuntimeError(f"Failed to get tasks: {e}")
@@ -368,20 +432,18 @@ async def get_tasks_handler(arguments: dict[str, Any], ctx: Any) -> list[types.C
     if len(tasks) == 0:
         return [types.TextContent(type="text", text=f"There are no pending tasks in the specified time range of '{time_range}'.")]
     
-    returned_string = f"\nPending Tasks for Time Range '{time_range}':\n\n"
+    # Collect lines and join once; repeated += on a str is quadratic
+    parts = [f"\nPending Tasks for Time Range '{time_range}':\n"]
     
-    for i in range(len(tasks)):
-        task =  tasks[i]
-        pre = "\n" if i > 0 else ""
-        returned_string += pre + f"{task['title']}\n- Due Date: {task['due_date']}"
-        if task["project"] is not None:
-            returned_string += f"\n- Associated Project: {task['project']['title']}"
-        if task["course"] is not None:
-            returned_string += f"\n- Associated Course: {task['course']['title']}"
+    for task in tasks:
+        parts.append(f"{task.title}\n- Due Date: {task.due_date}")
+        if task.project is not None:
+            parts.append(f"- Associated Project: {task.project.title}")
+        if task.course is not None:
+            parts.append(f"- Associated Course: {task.course.title}")
+        parts.append("")
             
-        returned_string += "\n"
-            
-    return [types.TextContent(type="text", text=returned_string)]
+    return [types.TextContent(type="text", text="\n".join(parts))]
             
             
 
@@ -396,22 +458,19 @@ get_projects_spec = types.Tool(
 
 async def get_projects_handler(arguments: dict[str, Any], ctx: Any) -> list[types.ContentBlock]:
     try:
-        projects = get_projects()
+        projects = await get_projects()
     except Exception as e:
         logger.exception("Failed to get projects")
         raise RuntimeError(f"Failed to get projects: {e}")
     
-    returned_string = "\nActive Projects:\n\n"
     if len(projects) == 0:
-        returned_string += "No active projects found."
-        return [types.TextContent(type="text", text=returned_string)]
+        return [types.TextContent(type="text", text="\nActive Projects:\n\nNo active projects found.")]
     
-    for i in range(len(projects)):
-        project = projects[i]
-        pre = "\n" if i > 0 else ""
-        returned_string += pre + f"{project['title']}\n- ID: {project['id']}\n"
+    parts = ["\nActive Projects:\n"]
+    for project in projects:
+        parts.append(f"{project.title}\n- ID: {project.id}\n")
     
-    return [types.TextContent(type="text", text=returned_string)]
+    return [types.TextContent(type="text", text="\n".join(parts))]
 
 
 get_courses_spec = types.Tool(
@@ -425,22 +484,19 @@ get_courses_spec = types.Tool(
 
 async def get_courses_handler(arguments: dict[str, Any], ctx: Any) -> list[types.ContentBlock]:
     try:
-        courses = get_courses()
+        courses = await get_courses()
     except Exception as e:
         logger.exception("Failed to get courses")
         raise RuntimeError(f"Failed to get courses: {e}")
     
-    returned_string = "\nActive Courses:\n\n"
     if len(courses) == 0:
-        returned_string += "No active courses found."
-        return [types.TextContent(type="text", text=returned_string)]
+        return [types.TextContent(type="text", text="\nActive Courses:\n\nNo active courses found.")]
     
-    for i in range(len(courses)):
-        course = courses[i]
-        pre = "\n" if i > 0 else ""
-        returned_string += pre + f"{course['title']}\n- Description: {course['description']}\n- ID: {course['id']}\n"
+    parts = ["\nActive Courses:\n"]
+    for course in courses:
+        parts.append(f"{course.title}\n- Description: {course.description}\n- ID: {course.id}\n")
     
-    return [types.TextContent(type="text", text=returned_string)]
+    return [types.TextContent(type="text", text="\n".join(parts))]
 
 
 create_task_spec = types.Tool(
@@ -460,9 +516,9 @@ create_task_spec = types.Tool(
             },
             "priority": {
                 "type": "integer",
-                "description": "Task priority: 1 (highest) .. 3 (lowest)",
+                "description": f"Task priority: 1 (highest) .. {len(PRIORITY_NAMES) - 1} (lowest)",
                 "minimum": 1,
-                "maximum": 3
+                "maximum": len(PRIORITY_NAMES) - 1
             },
             "project_id": {
                 "type": "string",
@@ -478,14 +534,8 @@ create_task_spec = types.Tool(
 
 async def create_task_handler(arguments: dict[str, Any], ctx: Any) -> list[types.ContentBlock]:
     try:
-        params: CreateTaskParams = {
-            "title": arguments.get("title"),
-            "due_date": arguments.get("due_date"),
-            "priority": arguments.get("priority"),
-            "project_id": arguments.get("project_id"),
-            "course_id": arguments.get("course_id"),
-        }
-        url = create_task(params)
+        params = CreateTaskParams.from_arguments(arguments)
+        url = await create_task(params)
     except Exception as e:
         logger.exception("Failed to create task")
         raise RuntimeError(f"Failed to create task: {e}")
@@ -1,15 +1,31 @@
 from datetime import datetime, timezone, timedelta
+from typing import NamedTuple
 
-def get_priority_name(priority: int) -> str:
-    if priority == 1:
-        return "P1 ‼️"
-    elif priority == 2:
-        return "P2"
-    elif priority == 3:
-        return "P3"
-    else:
-        return "P1 ‼️"
+class Project(NamedTuple):
+    title: str
+    id: str
 
+class Course(NamedTuple):
+    title: str
+    description: str
+    id: str
+
+class Task(NamedTuple):
+    title: str
+    due_date: str | None
+    # Relation page id as parsed; replaced by the record when tasks are enriched
+    project: str | Project | None
+    course: str | Course | None
+
+# time_range -> (start, end) offsets in days from today (UTC), both inclusive
+_TIME_RANGE_OFFSETS = {
+    "today": (0, 0),
+    "tomorrow": (1, 1),
+    "week_from_today": (0, 7),
+}
+
+# Notion select names indexed by priority (1 = highest); index 0 is unused
+PRIORITY_NAMES = (None, "P1 ‼️", "P2", "P3")
 
 def build_date_filter(time_range: str) -> dict:
     """
@@ -21,24 +37,15 @@ def build_date_filter(time_range: str) -> dict:
     Returns:
         A dict containing the date filter conditions for Notion API
     """
-    now = datetime.now(timezone.utc)
-    
-    if time_range == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-    elif time_range == "tomorrow":
-        tomorrow = now + timedelta(days=1)
-        start = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = tomorrow.replace(hour=23, minute=59, second=59, microsecond=999999)
-    elif time_range == "week_from_today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = (now + timedelta(days=7)).replace(hour=23, minute=59, second=59, microsecond=999999)
-    else:
+    try:
+        start_offset, end_offset = _TIME_RANGE_OFFSETS[time_range]
+    except KeyError:
         raise ValueError(f"Invalid time_range: {time_range}. Must be 'today', 'tomorrow', or 'week_from_today'")
     
-    # Format dates as ISO 8601 strings
-    start_str = start.date().isoformat()
-    end_str = end.date().isoformat()
+    # Only the date part reaches Notion, so work with dates directly
+    today = datetime.now(timezone.utc).date()
+    start_str = (today + timedelta(days=start_offset)).isoformat()
+    end_str = (today + timedelta(days=end_offset)).isoformat()
     
     return {
         "and": [
@@ -57,38 +64,57 @@ def build_date_filter(time_range: str) -> dict:
         ]
     }
     
-def check_if_projects_or_courses_exist(tasks: list[dict]):
-    for t in tasks:
-        if (t["project"] is not None):
-            return True
-        if (t["course"] is not None):
-            return True
+def collect_relation_ids(tasks: list[Task]) -> tuple[set[str], set[str]]:
+    """
+    Collect the project and course ids referenced by the tasks.
+    
+    Returns:
+        A (project_ids, course_ids) tuple of sets
+    """
+    project_ids = {t.project for t in tasks if t.project is not None}
+    course_ids = {t.course for t in tasks if t.course is not None}
     
-    return False
+    return project_ids, course_ids
+
+def get_status_name(page: dict) -> str | None:
+    status = page["properties"].get("Status", {}).get("status")
+    return status["name"] if status else None
+
+# Properties read by each parser (plus Status, checked on retrieved pages);
+# queries ask Notion for only these via `filter_properties`
+TASK_PROPERTIES = ("Name", "Due Date", "Project", "Course")
+PROJECT_PROPERTIES = ("Name", "Status")
+COURSE_PROPERTIES = ("Name", "Description", "Status")
+
+def _first_plain_text(items: list[dict] | None) -> str:
+    return items[0]["plain_text"] if items else ""
 
-def retrieve_task_info(task: dict) -> dict:
+def _first_relation_id(props: dict, name: str) -> str | None:
+    relation = props.get(name, {}).get("relation")
+    return relation[0]["id"] if relation else None
+
+def retrieve_task_info(task: dict) -> Task:
     props = task["properties"]
-    title = props["Name"]["title"][0]["plain_text"]
-    due_date = props["Due Date"]["date"]["start"]
-    project = props["Project"]["relation"][0]["id"] if len(props["Project"]["relation"]) > 0 else None
-    course = props["Course"]["relation"][0]["id"] if len(props["Course"]["relation"]) > 0 else None
+    title = _first_plain_text(props["Name"]["title"])
+    due = props["Due Date"]["date"]
     
-    return {
-        "title": title,
-        "due_date": due_date,
-        "project": project,
-        "course": course
-    }
+    return Task(
+        title=title,
+        due_date=due["start"] if due else None,
+        project=_first_relation_id(props, "Project"),
+        course=_first_relation_id(props, "Course")
+    )
     
-def retrieve_project_info(project: dict) -> dict:
-    title = project["properties"]["Name"]["title"][0]["plain_text"]
+def retrieve_project_info(project: dict) -> Project:
+    title = _first_plain_text(project["properties"]["Name"]["title"])
     id = project["id"]
     
-    return {"title": title, "id": id}
+    return Project(title=title, id=id)
 
-def retrieve_course_info(course: dict) -> dict:
-    title = course["properties"]["Name"]["title"][0]["plain_text"]
-    description = course["properties"]["Description"]["rich_text"][0]["plain_text"]
+def retrieve_course_info(course: dict) -> Course:
+    props = course["properties"]
+    title = _first_plain_text(props["Name"]["title"])
+    description = _first_plain_text(props.get("Description", {}).get("rich_text"))
     id = course["id"]
     
-    return {"title": title, "description": description, "id": id}
\ No newline at end of file
+    return Course(title=title, description=description, id=id)
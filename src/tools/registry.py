@@ -6,21 +6,28 @@ ToolHandler = Callable[[Dict[str, Any], Any], Awaitable[List[types.ContentBlock]
 
 _TOOL_SPECS: Dict[str, types.Tool] = {}
 _TOOL_HANDLERS: Dict[str, ToolHandler] = {}
+# Cached result of list_all_tools(); the tool set is static once registration is done
+_TOOL_LIST: List[types.Tool] | None = None
 
 
 def register_tool(spec: types.Tool, handler: ToolHandler) -> None:
+    global _TOOL_LIST
     _TOOL_SPECS[spec.name] = spec
     _TOOL_HANDLERS[spec.name] = handler
+    _TOOL_LIST = None
 
 
 def list_all_tools() -> List[types.Tool]:
-    return list(_TOOL_SPECS.values())
+    global _TOOL_LIST
+    if _TOOL_LIST is None:
+        _TOOL_LIST = list(_TOOL_SPECS.values())
+    return _TOOL_LIST
 
 
 async def dispatch(name: str, arguments: Dict[str, Any], ctx: Any) -> List[types.ContentBlock]:
-    if name not in _TOOL_HANDLERS:
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
-    handler = _TOOL_HANDLERS[name]
     return await handler(arguments, ctx)
 
 